@@ -0,0 +1,138 @@
+"""
+非同期(ASGI)の読み取り専用エンドポイント
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8000
+
+/api/async/ 以下は SQLAlchemy の非同期エンジン (psycopg 3 の asyncio 対応) で処理し、
+それ以外のパスは従来の Flask アプリへそのまま渡す。
+DB の応答待ちの間も同じワーカーで他のリクエストを処理できる。
+"""
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from a2wsgi import WSGIMiddleware
+from sqlalchemy import tuple_
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
+
+from app import (app as flask_app, db, User, StudyPost, Reference, StudyCategory,
+                 replica_uri, stats_range, build_stats_queries, shape_stats, start_scheduler)
+
+# 読み取り専用なので、レプリカがあればレプリカへ接続する
+async_engine = create_async_engine(replica_uri or flask_app.config['SQLALCHEMY_DATABASE_URI'],
+                                   pool_size=10, max_overflow=20)
+AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+TIMELINE_LIMIT = 100   # タイムライン・検索の最大取得件数
+
+def int_arg(request, name, default=None):
+    try:
+        return int(request.query_params[name])
+    except (KeyError, ValueError):
+        return default
+
+########################
+# ●学習統計 (dashboard_graph.html と同じ集計)
+########################
+async def stats(request):
+    async with AsyncSession() as session:
+        user_id = await session.scalar(
+            db.select(User.id).filter_by(username=request.query_params.get('user')))
+        if user_id is None:
+            return JSONResponse({'status': 'error', 'message': 'ユーザーが見つかりません'}, status_code=404)
+
+        start_date, end_date, granularity = stats_range(request.query_params.get('term', 'month'),
+                                                        request.query_params.get('granularity'))
+        bar_stmt, pie_stmt = build_stats_queries(user_id, start_date, granularity)
+        bar_rows = (await session.execute(bar_stmt)).all()
+        pie_rows = (await session.execute(pie_stmt)).all()
+
+    data = shape_stats(bar_rows, pie_rows, start_date, end_date, granularity,
+                       downsample=request.query_params.get('downsample') == '1')
+    return JSONResponse(data)
+
+########################
+# ●タイムライン (index.html と同じ並び順)
+########################
+async def timeline(request):
+    limit = min(int_arg(request, 'limit', 20), TIMELINE_LIMIT)
+    stmt = db.select(
+        StudyPost.id, StudyPost.title, StudyPost.content, StudyPost.created_at, User.username
+    ).join(User).order_by(StudyPost.created_at.desc(), StudyPost.id.desc()).limit(limit)
+
+    # ?before=<ISO形式の日時>&before_id=<投稿ID> で続きを取得する
+    # (created_at は分単位に丸められて重複するため、ID と組み合わせたキーで区切る)
+    before = request.query_params.get('before')
+    before_id = int_arg(request, 'before_id')
+    if before:
+        try:
+            before_at = datetime.fromisoformat(before)
+        except ValueError:
+            return JSONResponse({'status': 'error', 'message': 'before の形式が不正です'}, status_code=400)
+        if before_id is None:
+            return JSONResponse({'status': 'error', 'message': 'before_id を指定して下さい'}, status_code=400)
+        stmt = stmt.filter(tuple_(StudyPost.created_at, StudyPost.id) < tuple_(before_at, before_id))
+
+    async with AsyncSession() as session:
+        rows = (await session.execute(stmt)).all()
+
+    # 最後の行を次ページのカーソルとして返す (件数が limit 未満なら続きは無い)
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = {'before': rows[-1].created_at.isoformat(), 'before_id': rows[-1].id}
+
+    return JSONResponse({
+        'posts': [{
+            'id': r.id,
+            'title': r.title,
+            'content': r.content,
+            'author': r.username,
+            'created_at': r.created_at.isoformat(),
+        } for r in rows],
+        'next': next_cursor,
+    })
+
+########################
+# ●参照データ検索 (dashboard.html の絞り込みと同じ条件)
+########################
+async def reference_search(request):
+    limit = min(int_arg(request, 'limit', 50), TIMELINE_LIMIT)
+    stmt = db.select(
+        Reference.id, Reference.title, Reference.url, Reference.rating,
+        StudyCategory.name.label('category'), StudyPost.title.label('post_title')
+    ).join(StudyPost).outerjoin(StudyCategory).order_by(Reference.id.desc()).limit(limit)
+
+    keyword = request.query_params.get('q')
+    if keyword:
+        stmt = stmt.filter(Reference.title.ilike(f"%{keyword}%"))
+    category_id = int_arg(request, 'category_id')
+    if category_id:
+        stmt = stmt.filter(Reference.category_id == category_id)
+    min_rating = int_arg(request, 'min_rating')
+    if min_rating is not None:
+        stmt = stmt.filter(Reference.rating >= min_rating)
+
+    async with AsyncSession() as session:
+        rows = (await session.execute(stmt)).all()
+
+    return JSONResponse([dict(r._mapping) for r in rows])
+
+@asynccontextmanager
+async def lifespan(app):
+    # 管理者ジョブ・自動投稿はサーバーとして起動したプロセスでのみ実行する
+    start_scheduler()
+    yield
+    await async_engine.dispose()
+
+app = Starlette(
+    routes=[
+        Route('/api/async/stats', stats),
+        Route('/api/async/timeline', timeline),
+        Route('/api/async/references', reference_search),
+        # 上記以外は従来の Flask アプリで処理する
+        Mount('/', app=WSGIMiddleware(flask_app)),
+    ],
+    lifespan=lifespan,
+)
@@ -0,0 +1,60 @@
+"""
+同期(Flask)版と非同期(ASGI)版の学習統計エンドポイントの同時実行性能を比較する
+
+使い方 (それぞれワーカー1つで起動しておく):
+    flask --app app run --port 5000 --without-threads
+    uvicorn asgi:app --port 8000 --workers 1
+
+    python benchmarks/async_vs_sync.py --user admin --concurrency 32 --requests 500
+
+同じ並列数でリクエストを送り、スループットとレイテンシを表示する。
+"""
+import argparse
+import statistics
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+TARGETS = {
+    "sync":  "http://localhost:5000/api/stats",
+    "async": "http://localhost:8000/api/async/stats",
+}
+
+def fetch(url):
+    started = time.perf_counter()
+    with urllib.request.urlopen(url) as res:
+        res.read()
+    return time.perf_counter() - started
+
+def run(url, total, concurrency):
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        started = time.perf_counter()
+        latencies = list(pool.map(fetch, [url] * total))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "req_per_sec": total / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--user", default="admin")
+    parser.add_argument("--term", default="year")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--sync-url", default=TARGETS["sync"])
+    parser.add_argument("--async-url", default=TARGETS["async"])
+    args = parser.parse_args()
+
+    query = "?" + urllib.parse.urlencode({"user": args.user, "term": args.term})
+    for name, url in (("sync", args.sync_url), ("async", args.async_url)):
+        fetch(url + query)  # ウォームアップ (接続プールの確立)
+        result = run(url + query, args.requests, args.concurrency)
+        print(f"{name:5s} {result['req_per_sec']:8.1f} req/s  "
+              f"p50={result['p50_ms']:7.1f}ms  p95={result['p95_ms']:7.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+//////////////////////////////////////////////////////////////////////////////////////////
+// administrator.html
+//////////////////////////////////////////////////////////////////////////////////////////
+
+const JOB_KIND_NAMES = {
+    grp_dat_gen: 'グラフ用データ生成',
+    ref_dat_gen: '参考情報データ生成',
+    delete_user: 'ユーザー削除',
+};
+const JOB_STATUS_BADGES = {
+    queued: ['bg-secondary', '待機中'],
+    running: ['bg-primary', '実行中'],
+    done: ['bg-success', '完了'],
+    failed: ['bg-danger', '失敗'],
+    cancelled: ['bg-warning text-dark', '取消'],
+};
+
+///////////////////////////////////////////////////////////////////////////////////////
+//  ●ジョブ一覧の描画
+///////////////////////////////////////////////////////////////////////////////////////
+function renderJobs(jobs) {
+    const tbody = document.getElementById('job-table-body');
+    tbody.innerHTML = '';
+
+    if (jobs.length === 0) {
+        const row = tbody.insertRow();
+        const cell = row.insertCell();
+        cell.colSpan = 7;
+        cell.className = 'text-center text-muted';
+        cell.textContent = '実行されたジョブはありません。';
+        return;
+    }
+
+    jobs.forEach(job => {
+        const row = tbody.insertRow();
+        row.insertCell().textContent = job.id;
+        row.insertCell().textContent = JOB_KIND_NAMES[job.kind] || job.kind;
+        row.insertCell().textContent = job.params.username || '-';
+
+        // 進捗バー
+        const percent = job.total ? Math.round(job.progress * 100 / job.total) : 0;
+        const progressCell = row.insertCell();
+        progressCell.innerHTML = `
+            <div class="progress" style="height: 1rem;">
+                <div class="progress-bar" role="progressbar" style="width: ${percent}%;">${job.progress}/${job.total}</div>
+            </div>`;
+
+        // 状態 (失敗時はメッセージをツールチップに表示)
+        const [badgeClass, label] = JOB_STATUS_BADGES[job.status] || ['bg-light text-dark', job.status];
+        const badge = document.createElement('span');
+        badge.className = `badge ${badgeClass}`;
+        badge.textContent = job.cancel_requested && job.status === 'running' ? '取消中' : label;
+        if (job.message) badge.title = job.message;
+        row.insertCell().appendChild(badge);
+
+        row.insertCell().textContent = job.created_at;
+
+        // キャンセルボタン
+        const actionCell = row.insertCell();
+        actionCell.className = 'text-center';
+        if ((job.status === 'queued' || job.status === 'running') && !job.cancel_requested) {
+            const button = document.createElement('button');
+            button.className = 'btn btn-outline-danger btn-sm py-0';
+            button.textContent = '取消';
+            button.addEventListener('click', () => cancelJob(job.id));
+            actionCell.appendChild(button);
+        }
+    });
+}
+
+///////////////////////////////////////////////////////////////////////////////////////
+//  ●ジョブ状態の定期取得 (実行中のジョブがある間は短い間隔で確認)
+///////////////////////////////////////////////////////////////////////////////////////
+async function pollJobs() {
+    let active = false;
+    try {
+        const response = await fetch('/api/jobs');
+        const jobs = await response.json();
+        renderJobs(jobs);
+        active = jobs.some(job => job.status === 'queued' || job.status === 'running');
+    } catch (error) {
+        console.error('Error:', error);
+    }
+    setTimeout(pollJobs, active ? 2000 : 10000);
+}
+
+async function cancelJob(jobId) {
+    if (!confirm(`ジョブ #${jobId} を取り消しますか？`)) return;
+    try {
+        await fetch(`/jobs/${jobId}/cancel`, { method: 'POST' });
+    } catch (error) {
+        console.error('Error:', error);
+    }
+}
+
+pollJobs();
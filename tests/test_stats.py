@@ -0,0 +1,57 @@
+"""学習統計の集計単位・0埋め・間引き処理のテスト (DB 不要)"""
+from collections import namedtuple
+from datetime import date, datetime
+
+from freezegun import freeze_time
+
+from app import iter_buckets, downsample_lttb, shape_stats, stats_range
+
+BarRow = namedtuple('BarRow', ['bucket', 'total_minutes'])
+PieRow = namedtuple('PieRow', ['label', 'total_minutes'])
+
+
+def test_month_buckets_start_on_first_day_and_cross_year():
+    buckets = list(iter_buckets(date(2025, 11, 15), date(2026, 2, 3), 'month'))
+    assert buckets == [date(2025, 11, 1), date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1)]
+
+
+def test_week_buckets_start_on_monday():
+    # 2026-10-15 は木曜日 -> 同じ週の月曜日 2026-10-12 から始まる
+    buckets = list(iter_buckets(date(2026, 10, 15), date(2026, 10, 26), 'week'))
+    assert buckets == [date(2026, 10, 12), date(2026, 10, 19), date(2026, 10, 26)]
+    assert all(day.weekday() == 0 for day in buckets)
+
+
+def test_days_without_study_are_zero_filled():
+    rows = [BarRow(datetime(2026, 10, 1), 120), BarRow(datetime(2026, 10, 3), 30)]
+    data = shape_stats(rows, [PieRow('Python', 150)],
+                       datetime(2026, 10, 1, 9), datetime(2026, 10, 3, 18), 'day')
+    assert data['bar_labels'] == ['2026-10-01', '2026-10-02', '2026-10-03']
+    assert data['bar_values'] == [2.0, 0, 0.5]
+    assert data['pie_labels'] == ['Python']
+    assert 'raw_data' not in data
+
+
+@freeze_time('2026-10-19 12:00:00')
+def test_stats_range_uses_default_granularity_for_term():
+    start, end, granularity = stats_range('year')
+    assert granularity == 'month'
+    assert end == datetime(2026, 10, 19, 12)
+    assert start == datetime(2025, 10, 19, 12)
+    assert stats_range('year', 'week')[2] == 'week'
+    assert stats_range('unknown', 'hour')[2] == 'day'
+
+
+def test_lttb_keeps_length_and_end_points():
+    labels = list(range(1000))
+    values = [(i * 37) % 101 for i in labels]
+    sampled_labels, sampled_values = downsample_lttb(labels, values, 100)
+    assert len(sampled_labels) == len(sampled_values) == 100
+    assert sampled_labels[0] == 0 and sampled_labels[-1] == 999
+    assert sampled_values[0] == values[0] and sampled_values[-1] == values[-1]
+    assert sampled_labels == sorted(set(sampled_labels))
+
+
+def test_lttb_returns_short_series_unchanged():
+    labels, values = ['a', 'b', 'c'], [1, 2, 3]
+    assert downsample_lttb(labels, values, 100) == (labels, values)